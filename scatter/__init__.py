@@ -9,6 +9,7 @@ from .errors import (
     GatewayError,
     HTTPException,
     NotFound,
+    RateLimited,
     ScatterException,
 )
 from .models import (
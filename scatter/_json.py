@@ -0,0 +1,43 @@
+"""JSON encoding/decoding, using orjson or msgspec when installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+if orjson is not None:
+
+    def loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+elif msgspec is not None:
+    _decoder = msgspec.json.Decoder()
+    _encoder = msgspec.json.Encoder()
+
+    def loads(data: bytes | str) -> Any:
+        return _decoder.decode(data)
+
+    def dumps(obj: Any) -> str:
+        return _encoder.encode(obj).decode()
+
+else:
+
+    def loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
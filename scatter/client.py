@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Callable, Coroutine
+from typing import Any, AsyncIterator, Callable, Coroutine, Iterable
 
-from .events import EVENT_MAP, parse_event
+from .events import CACHE_INVALIDATIONS, DISPATCH_TABLE, parse_event
 from .gateway import Gateway
 from .http import HTTPClient
 from .models import (
@@ -27,6 +27,14 @@ log = logging.getLogger(__name__)
 _TYPING_INTERVAL = 4.0
 
 
+async def _safe(coro: Callable[..., Coroutine], arg: Any, msg: str, name: str):
+    """Await ``coro(arg)``, logging instead of raising on failure."""
+    try:
+        await coro(arg)
+    except Exception:
+        log.exception(msg, name)
+
+
 class Typing:
     """Async context manager that sends typing indicators continuously.
 
@@ -38,31 +46,38 @@ class Typing:
             await client.send_message(space_id, channel_id, result)
     """
 
+    __slots__ = ("_client", "_channel_id", "_loop", "_handle", "_task")
+
     def __init__(self, client: Client, channel_id: str):
         self._client = client
         self._channel_id = channel_id
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._handle: asyncio.TimerHandle | None = None
         self._task: asyncio.Task | None = None
 
     async def __aenter__(self):
         await self._client.send_typing(self._channel_id)
-        self._task = asyncio.create_task(self._loop())
+        self._loop = self._client._loop or asyncio.get_running_loop()
+        self._handle = self._loop.call_later(_TYPING_INTERVAL, self._tick)
         return self
 
     async def __aexit__(self, *exc):
-        if self._task is not None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._task is not None and not self._task.done():
             self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
 
-    async def _loop(self):
+    def _tick(self):
+        assert self._loop is not None
+        self._task = self._loop.create_task(self._send())
+        self._handle = self._loop.call_later(_TYPING_INTERVAL, self._tick)
+
+    async def _send(self):
         try:
-            while True:
-                await asyncio.sleep(_TYPING_INTERVAL)
-                await self._client.send_typing(self._channel_id)
-        except asyncio.CancelledError:
-            pass
+            await self._client.send_typing(self._channel_id)
+        except Exception:
+            log.exception("Error sending typing indicator")
 
 
 class Client:
@@ -94,14 +109,23 @@ class Client:
         *,
         base_url: str | None = None,
         ws_url: str | None = None,
+        cache_ttl: float | None = None,
+        cache_enabled: bool = True,
+        http_backend: str | None = None,
     ):
         self._token = token
         self.user_id: str | None = None
+        # Set by start(); lets helpers like Typing skip get_running_loop().
+        self._loop: asyncio.AbstractEventLoop | None = None
 
-        http_kwargs: dict[str, Any] = {}
+        http_kwargs: dict[str, Any] = {"cache_enabled": cache_enabled}
         gw_kwargs: dict[str, Any] = {}
         if base_url:
             http_kwargs["base_url"] = base_url
+        if cache_ttl is not None:
+            http_kwargs["cache_ttl"] = cache_ttl
+        if http_backend:
+            http_kwargs["http_backend"] = http_backend
         if ws_url:
             gw_kwargs["ws_url"] = ws_url
 
@@ -109,6 +133,10 @@ class Client:
         self._gateway = Gateway(token, self._dispatch, **gw_kwargs)
         self._event_handlers: dict[str, Callable[..., Coroutine]] = {}
         self._listeners: dict[str, list[Callable[..., Coroutine]]] = {}
+        # raw event type -> (handler name, ((callable, error message), ...)).
+        # Rebuilt lazily on the first dispatch after a handler is registered.
+        self._dispatch_table: dict[str, tuple[str, tuple]] = {}
+        self._dispatch_dirty = True
 
     # ── Event Registration ──────────────────────────────────────
 
@@ -127,6 +155,7 @@ class Client:
         if not name.startswith("on_"):
             raise ValueError(f"Event handler name must start with 'on_', got '{name}'")
         self._event_handlers[name] = coro
+        self._dispatch_dirty = True
         return coro
 
     def listen(self, event_name: str | None = None):
@@ -145,48 +174,73 @@ class Client:
         def decorator(coro: Callable[..., Coroutine]) -> Callable[..., Coroutine]:
             key = event_name or coro.__name__
             self._listeners.setdefault(key, []).append(coro)
+            self._dispatch_dirty = True
             return coro
 
         return decorator
 
     # ── Internal Dispatch ───────────────────────────────────────
 
+    def _build_dispatch_table(self):
+        table: dict[str, tuple[str, tuple]] = {}
+        for event_type, handler_name in DISPATCH_TABLE.items():
+            callbacks = []
+            handler = self._event_handlers.get(handler_name)
+            if handler is not None:
+                callbacks.append((handler, "Error in event handler %s"))
+            for listener in self._listeners.get(handler_name, ()):
+                callbacks.append((listener, "Error in listener for %s"))
+            table[event_type] = (handler_name, tuple(callbacks))
+        self._dispatch_table = table
+        self._dispatch_dirty = False
+
     async def _dispatch(self, event_type: str, data: dict):
         """Called by the Gateway for each incoming WS event."""
-        # Map raw event type to handler name
-        mapped = EVENT_MAP.get(event_type)
-        if mapped is None:
+        if self._dispatch_dirty:
+            self._build_dispatch_table()
+
+        entry = self._dispatch_table.get(event_type)
+        if entry is None:
             log.debug("Unhandled event type: %s", event_type)
             return
+        handler_name, callbacks = entry
 
-        handler_name = f"on_{mapped}"
+        stale = CACHE_INVALIDATIONS.get(event_type)
+        if stale is not None:
+            self._invalidate_cached(stale, data)
 
         # Special handling for ready event
-        if mapped == "ready":
+        if handler_name == "on_ready":
             self.user_id = data.get("user_id")
 
+        if not callbacks:
+            return
+
         # Parse the raw data into model objects
         parsed = parse_event(event_type, data)
 
-        # Call the @client.event handler
-        handler = self._event_handlers.get(handler_name)
-        if handler is not None:
+        # Run the @client.event handler and all @client.listen handlers
+        # concurrently, so one slow handler doesn't delay the rest.
+        if len(callbacks) == 1:
+            coro, msg = callbacks[0]
+            await _safe(coro, parsed, msg, handler_name)
+        else:
+            await asyncio.gather(
+                *(_safe(coro, parsed, msg, handler_name) for coro, msg in callbacks)
+            )
+
+    def _invalidate_cached(self, paths: tuple[str, ...], data: dict):
+        for path in paths:
             try:
-                await handler(parsed)
-            except Exception:
-                log.exception("Error in event handler %s", handler_name)
-
-        # Call all @client.listen handlers
-        for listener in self._listeners.get(handler_name, []):
-            try:
-                await listener(parsed)
-            except Exception:
-                log.exception("Error in listener for %s", handler_name)
+                self.http._invalidate(path.format_map(data))
+            except KeyError as e:
+                log.debug("Can't invalidate %s: event has no %s", path, e)
 
     # ── Connection ──────────────────────────────────────────────
 
     async def start(self):
         """Connect to the gateway and block until disconnected."""
+        self._loop = asyncio.get_running_loop()
         await self._gateway.connect()
 
     async def close(self):
@@ -209,36 +263,36 @@ class Client:
     async def subscribe_channel(self, channel_id: str):
         """Subscribe to events for a channel (messages, typing, reactions)."""
         self._gateway.track_channel(channel_id)
-        await self._gateway.send(
-            {"type": "subscribe", "channel_id": channel_id}
-        )
+        await self._gateway.send_id("subscribe", "channel_id", channel_id)
+
+    async def subscribe_channels(self, channel_ids: Iterable[str]):
+        """Subscribe to events for many channels at once.
+
+        Sent as a single batched frame when the server supports it.
+        """
+        ids = list(channel_ids)
+        for channel_id in ids:
+            self._gateway.track_channel(channel_id)
+        await self._gateway.subscribe_channels(ids)
 
     async def unsubscribe_channel(self, channel_id: str):
         """Unsubscribe from channel events."""
         self._gateway.untrack_channel(channel_id)
-        await self._gateway.send(
-            {"type": "unsubscribe", "channel_id": channel_id}
-        )
+        await self._gateway.send_id("unsubscribe", "channel_id", channel_id)
 
     async def subscribe_space(self, space_id: str):
         """Subscribe to space events (members, roles, channels, etc.)."""
         self._gateway.track_space(space_id)
-        await self._gateway.send(
-            {"type": "subscribe_space", "space_id": space_id}
-        )
+        await self._gateway.send_id("subscribe_space", "space_id", space_id)
 
     async def unsubscribe_space(self, space_id: str):
         """Unsubscribe from space events."""
         self._gateway.untrack_space(space_id)
-        await self._gateway.send(
-            {"type": "unsubscribe_space", "space_id": space_id}
-        )
+        await self._gateway.send_id("unsubscribe_space", "space_id", space_id)
 
     async def send_typing(self, channel_id: str):
         """Send a single typing indicator for a channel."""
-        await self._gateway.send(
-            {"type": "typing", "channel_id": channel_id}
-        )
+        await self._gateway.send_id("typing", "channel_id", channel_id)
 
     def typing(self, channel_id: str) -> Typing:
         """Return an async context manager that sends typing indicators.
@@ -266,18 +320,63 @@ class Client:
         etc. to load them on demand.
         """
         data = await self.http.get_space(space_id)
-        return Space.from_dict(data)
+        return Space.from_dict_cached(data)
+
+    async def fetch_space_bundle(self, space_id: str) -> Space:
+        """Fetch a space together with all of its sub-resources.
+
+        The space, channels, members, roles, categories and emojis are
+        requested concurrently, so this costs about one round-trip rather
+        than six. The returned :class:`Space` has every lazy field filled.
+        """
+        (
+            space_data,
+            channels,
+            members,
+            roles,
+            categories,
+            emojis,
+        ) = await asyncio.gather(
+            self.http.get_space(space_id),
+            self.http.get_channels(space_id),
+            self.http.get_members(space_id),
+            self.http.get_roles(space_id),
+            self.http.get_categories(space_id),
+            self.http.get_emojis(space_id),
+        )
+        space = Space.from_dict(space_data)
+        space.channels = [Channel.from_dict(c) for c in channels]
+        space.members = [Member.from_dict(m) for m in members]
+        space.roles = [Role.from_dict(r) for r in roles]
+        space.categories = [ChannelCategory.from_dict(c) for c in categories]
+        space.custom_emojis = [CustomEmoji.from_dict(e) for e in emojis]
+        return space
 
     async def fetch_channels(self, space_id: str) -> list[Channel]:
-        """Fetch all channels in a space."""
+        """Fetch all channels in a space.
+
+        Channels that haven't changed since a previous fetch (same
+        ``updated_at``) are returned as the same instances.
+        """
         data = await self.http.get_channels(space_id)
-        return [Channel.from_dict(c) for c in data]
+        return [Channel.from_dict_cached(c) for c in data]
 
     async def fetch_members(self, space_id: str) -> list[Member]:
         """Fetch all members in a space."""
         data = await self.http.get_members(space_id)
         return [Member.from_dict(m) for m in data]
 
+    async def iter_members(self, space_id: str) -> AsyncIterator[Member]:
+        """Like :meth:`fetch_members`, but build each :class:`Member` lazily.
+
+        Useful for large spaces when the members are only scanned once::
+
+            async for member in client.iter_members(space_id):
+                ...
+        """
+        for m in await self.http.get_members(space_id):
+            yield Member.from_dict(m)
+
     async def fetch_roles(self, space_id: str) -> list[Role]:
         """Fetch all roles in a space."""
         data = await self.http.get_roles(space_id)
@@ -302,6 +401,21 @@ class Client:
         )
         return [Message.from_dict(m, space_id=space_id) for m in data]
 
+    async def iter_messages(
+        self,
+        space_id: str,
+        channel_id: str,
+        *,
+        before: str | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[Message]:
+        """Like :meth:`fetch_messages`, but build each :class:`Message` lazily."""
+        data = await self.http.get_messages(
+            space_id, channel_id, before=before, limit=limit
+        )
+        for m in data:
+            yield Message.from_dict(m, space_id=space_id)
+
     async def send_message(
         self,
         space_id: str,
@@ -23,6 +23,17 @@ class Forbidden(HTTPException):
     """Raised for 403 responses."""
 
 
+class RateLimited(HTTPException):
+    """Raised for 429 responses once retries are exhausted.
+
+    ``retry_after`` is the server-requested wait in seconds, if given.
+    """
+
+    def __init__(self, status: int, body: dict, retry_after: float | None = None):
+        self.retry_after = retry_after
+        super().__init__(status, body)
+
+
 class GatewayError(ScatterException):
     """Raised for WebSocket-level errors."""
 
@@ -58,6 +58,41 @@ EVENT_MAP: dict[str, str] = {
     "dm_conversation_created": "dm_conversation_create",
 }
 
+# Maps raw WS event "type" string -> full handler name, e.g. "on_message".
+DISPATCH_TABLE: dict[str, str] = {
+    event_type: f"on_{name}" for event_type, name in EVENT_MAP.items()
+}
+
+
+# Maps raw WS event "type" string -> REST paths whose cached responses the
+# event makes stale. Paths are formatted with the event payload.
+# presence_changed is left out on purpose: it fires constantly and would
+# keep the member list from ever being served from cache.
+CACHE_INVALIDATIONS: dict[str, tuple[str, ...]] = {
+    # Pinned messages are returned in full, so edits and deletes reach them.
+    "message_edited": ("/spaces/{space_id}/channels/{channel_id}/pins",),
+    "message_deleted": ("/spaces/{space_id}/channels/{channel_id}/pins",),
+    "message_pinned": ("/spaces/{space_id}/channels/{channel_id}/pins",),
+    "message_unpinned": ("/spaces/{space_id}/channels/{channel_id}/pins",),
+    "member_joined": ("/spaces/{space_id}/members",),
+    "member_left": ("/spaces/{space_id}/members",),
+    "member_profile_updated": ("/spaces/{space_id}/members",),
+    "member_roles_updated": ("/spaces/{space_id}/members",),
+    "channel_created": ("/spaces/{space_id}/channels",),
+    "channel_updated": ("/spaces/{space_id}/channels",),
+    "channel_deleted": ("/spaces/{space_id}/channels",),
+    "channel_permissions_updated": ("/spaces/{space_id}/channels",),
+    "role_created": ("/spaces/{space_id}/roles",),
+    # Member payloads carry their roles, so role changes reach them too.
+    "role_updated": ("/spaces/{space_id}/roles", "/spaces/{space_id}/members"),
+    "role_deleted": ("/spaces/{space_id}/roles", "/spaces/{space_id}/members"),
+    "emoji_created": ("/spaces/{space_id}/emojis",),
+    "emoji_deleted": ("/spaces/{space_id}/emojis",),
+    "category_created": ("/spaces/{space_id}/categories",),
+    "category_updated": ("/spaces/{space_id}/categories",),
+    "category_deleted": ("/spaces/{space_id}/categories",),
+}
+
 
 def parse_event(event_type: str, data: dict):
     """Convert a raw WS event dict into the appropriate model object.
@@ -3,18 +3,42 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
+import re
 from typing import Callable
 
 import aiohttp
 
+from . import _json
 from .errors import AuthenticationError, GatewayError
 
 log = logging.getLogger(__name__)
 
 DEFAULT_WS_URL = "wss://scatter.starforge.games/ws"
 
+# IDs made only of these characters can be spliced into a JSON string
+# literal without escaping.
+_is_plain_id = re.compile(r"[A-Za-z0-9_-]+").fullmatch
+
+
+@functools.lru_cache(maxsize=None)
+def _frame_prefix(frame_type: str, key: str) -> str:
+    return f'{{"type":"{frame_type}","{key}":"'
+
+
+def _id_frame(frame_type: str, key: str, value: str) -> str:
+    """Encode ``{"type": frame_type, key: value}`` as a JSON string.
+
+    Plain IDs are concatenated onto a cached prefix instead of going
+    through ``json.dumps``; anything else is escaped properly.
+    """
+    prefix = _frame_prefix(frame_type, key)
+    if _is_plain_id(value):
+        return f'{prefix}{value}"}}'
+    return f"{prefix[:-1]}{json.dumps(value)}}}"
+
 
 class Gateway:
     """Manages the WebSocket connection to Scatter, with auto-reconnection."""
@@ -36,6 +60,8 @@ class Gateway:
         self._max_reconnect_delay = 60.0
         self._subscribed_channels: set[str] = set()
         self._subscribed_spaces: set[str] = set()
+        # Whether the server advertised "subscribe_batch" in auth_ok.
+        self._batch_subscribe = False
 
     async def connect(self):
         """Connect and enter the receive loop. Reconnects automatically on failure."""
@@ -73,20 +99,19 @@ class Gateway:
         assert self._ws is not None
         async for msg in self._ws:
             if msg.type == aiohttp.WSMsgType.TEXT:
-                data = json.loads(msg.data)
+                data = _json.loads(msg.data)
                 event_type = data.get("type")
 
                 if event_type == "auth_ok":
                     log.info("Authenticated as user %s", data.get("user_id"))
+                    # "features" may be missing or null on older servers.
+                    self._batch_subscribe = "subscribe_batch" in (
+                        data.get("features") or ()
+                    )
                     # Re-subscribe to everything we were tracking
-                    for ch_id in self._subscribed_channels:
-                        await self.send(
-                            {"type": "subscribe", "channel_id": ch_id}
-                        )
+                    await self.subscribe_channels(list(self._subscribed_channels))
                     for sp_id in self._subscribed_spaces:
-                        await self.send(
-                            {"type": "subscribe_space", "space_id": sp_id}
-                        )
+                        await self.send_id("subscribe_space", "space_id", sp_id)
                     await self._dispatch("auth_ok", data)
 
                 elif event_type == "error":
@@ -108,7 +133,33 @@ class Gateway:
     async def send(self, data: dict):
         """Send a JSON message over the WebSocket."""
         if self._ws and not self._ws.closed:
-            await self._ws.send_json(data)
+            await self._ws.send_json(data, dumps=_json.dumps)
+
+    async def send_raw(self, payload: str):
+        """Send an already-encoded JSON text frame."""
+        if self._ws and not self._ws.closed:
+            await self._ws.send_str(payload)
+
+    async def send_id(self, frame_type: str, key: str, value: str):
+        """Send a ``{"type": frame_type, key: value}`` frame.
+
+        Used for the small, frequent subscribe/typing frames.
+        """
+        await self.send_raw(_id_frame(frame_type, key, value))
+
+    async def subscribe_channels(self, channel_ids: list[str]):
+        """Send subscribe frames for ``channel_ids``.
+
+        Uses a single ``subscribe_batch`` frame when the server supports
+        it, otherwise one ``subscribe`` frame per channel.
+        """
+        if not channel_ids:
+            return
+        if self._batch_subscribe:
+            await self.send({"type": "subscribe_batch", "channel_ids": channel_ids})
+        else:
+            for ch_id in channel_ids:
+                await self.send_id("subscribe", "channel_id", ch_id)
 
     def track_channel(self, channel_id: str):
         """Track a channel subscription for auto-resubscribe on reconnect."""
@@ -2,38 +2,238 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import os
+import random
+import time
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
 from urllib.parse import quote
 
 import aiohttp
 
-from .errors import Forbidden, HTTPException, NotFound
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from . import _json
+from .errors import Forbidden, HTTPException, NotFound, RateLimited
 
 log = logging.getLogger(__name__)
 
 DEFAULT_BASE_URL = "https://scatter.starforge.games/api"
 
+# Default lifetime (seconds) of cached GET responses.
+DEFAULT_CACHE_TTL = 30.0
+
+# Idempotent methods whose concurrent identical requests share one call.
+_COALESCED_METHODS = frozenset({"GET", "HEAD"})
+
+# Maximum number of requests in flight at once.
+DEFAULT_MAX_CONCURRENCY = 32
+
+# How many times a 429 response is retried before raising RateLimited.
+DEFAULT_MAX_RETRIES = 3
+
+# Exponential backoff (seconds) for 429s that don't carry Retry-After.
+_BACKOFF_BASE = 0.5
+_BACKOFF_CAP = 30.0
+
+
+# Connection pool / timeout settings for the shared session. Every request
+# goes to the same host, so keeping connections alive avoids a TLS
+# handshake per call.
+_CONNECTOR_LIMIT = 100
+_CONNECTOR_LIMIT_PER_HOST = 32
+_KEEPALIVE_TIMEOUT = 75.0
+_DNS_CACHE_TTL = 300
+_TIMEOUT = aiohttp.ClientTimeout(total=30, sock_connect=10, sock_read=30)
+
+# Transports HTTPClient can run on. "httpx" speaks HTTP/2, multiplexing
+# every request over a single connection.
+HTTP_BACKENDS = ("aiohttp", "httpx")
+
+
+def _request_key(path: str, params: dict | None) -> tuple:
+    return (path, tuple(sorted(params.items())) if params else ())
+
+
+def _path_under(path: str, prefix: str) -> bool:
+    """True if ``path`` is ``prefix``, a path below it or it with a query."""
+    return path == prefix or path.startswith((prefix + "/", prefix + "?"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _quote_emoji(emoji: str) -> str:
+    # Bots tend to react with a small set of emojis; quote() is pure Python.
+    return quote(emoji, safe="")
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+def _raise_for_status(status: int, body, retry_after: float | None = None):
+    if status < 400:
+        return
+    if not isinstance(body, dict):
+        body = {"error": str(body)}
+    if status == 429:
+        raise RateLimited(status, body, retry_after)
+    if status == 404:
+        raise NotFound(status, body)
+    if status == 403:
+        raise Forbidden(status, body)
+    raise HTTPException(status, body)
+
 
 class HTTPClient:
-    """Low-level REST API client. Methods return raw dicts/lists."""
+    """Low-level REST API client. Methods return raw dicts/lists.
+
+    Responses from the read-only ``get_*`` endpoints (except messages) are
+    cached in memory for ``cache_ttl`` seconds. Mutating methods invalidate
+    the entries they affect; call :meth:`clear_cache` to drop everything.
+
+    Each instance owns one pooled, keep-alive session. Reuse a single
+    client for the lifetime of the bot rather than creating new ones.
+    With ``http_backend="httpx"`` (requires the ``http2`` extra) requests
+    are multiplexed over one HTTP/2 connection instead.
+
+    At most ``max_concurrency`` requests are in flight at once. 429
+    responses pause all requests for the server's ``Retry-After`` (or a
+    jittered exponential backoff) and are retried up to ``max_retries``
+    times before :class:`~scatter.RateLimited` is raised.
+    """
 
-    def __init__(self, token: str, *, base_url: str = DEFAULT_BASE_URL):
+    def __init__(
+        self,
+        token: str,
+        *,
+        base_url: str = DEFAULT_BASE_URL,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_enabled: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        http_backend: str = "aiohttp",
+    ):
+        if http_backend not in HTTP_BACKENDS:
+            raise ValueError(
+                f"http_backend must be one of {HTTP_BACKENDS}, got {http_backend!r}"
+            )
+        if http_backend == "httpx" and httpx is None:
+            raise ImportError(
+                "http_backend='httpx' requires httpx: "
+                "pip install \"scatter.py[http2]\""
+            )
         self._token = token
         self._base_url = base_url
+        self._backend = http_backend
         self._session: aiohttp.ClientSession | None = None
+        self._httpx: httpx.AsyncClient | None = None
+        # Loop the session was created on; cached to keep hot paths off
+        # asyncio.get_running_loop().
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._cache_ttl = cache_ttl
+        self._cache_enabled = cache_enabled
+        # (path, sorted params) -> (expires_at monotonic, raw body)
+        self._cache: dict[tuple, tuple[float, bytes]] = {}
+        # (method, path, sorted params) -> in-flight request task
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        # path prefix -> times invalidated; see _cached_get
+        self._generations: dict[str, int] = {}
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._max_retries = max_retries
+        # self._loop.time() before which no request may be sent (429 cooldown)
+        self._global_until = 0.0
 
     async def _ensure_session(self):
+        if self._backend == "httpx":
+            if self._httpx is None or self._httpx.is_closed:
+                self._loop = asyncio.get_running_loop()
+                self._httpx = httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=_CONNECTOR_LIMIT,
+                        max_keepalive_connections=_CONNECTOR_LIMIT_PER_HOST,
+                        keepalive_expiry=_KEEPALIVE_TIMEOUT,
+                    ),
+                    timeout=httpx.Timeout(30, connect=10, read=30),
+                    headers={"Authorization": f"Bearer {self._token}"},
+                )
+            return
+
         if self._session is None or self._session.closed:
+            self._loop = asyncio.get_running_loop()
+            # With the "speed" extra installed, resolve DNS through aiodns
+            # (older aiohttp releases never pick AsyncResolver by default);
+            # aiohttp advertises/decodes Brotli on its own.
+            connector = aiohttp.TCPConnector(
+                limit=_CONNECTOR_LIMIT,
+                limit_per_host=_CONNECTOR_LIMIT_PER_HOST,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=_DNS_CACHE_TTL,
+                enable_cleanup_closed=True,
+                resolver=aiohttp.AsyncResolver() if aiodns is not None else None,
+            )
             self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=_TIMEOUT,
+                json_serialize=_json.dumps,
                 headers={
                     "Authorization": f"Bearer {self._token}",
-                    "Content-Type": "application/json",
-                }
+                },
             )
 
     async def close(self):
         if self._session and not self._session.closed:
             await self._session.close()
+        if self._httpx and not self._httpx.is_closed:
+            await self._httpx.aclose()
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: dict | None = None,
+        params: dict | None = None,
+    ) -> tuple[int, Mapping[str, str], bytes]:
+        """Perform one HTTP exchange; returns (status, headers, raw body)."""
+        if self._httpx is not None:
+            headers = None
+            content = None
+            if json is not None:
+                headers = {"Content-Type": "application/json"}
+                content = _json.dumps(json).encode()
+            resp = await self._httpx.request(
+                method, url, content=content, headers=headers, params=params
+            )
+            return resp.status_code, resp.headers, resp.content
+
+        assert self._session is not None
+        async with self._session.request(
+            method, url, json=json, params=params
+        ) as resp:
+            return resp.status, resp.headers, await resp.read()
 
     async def request(
         self,
@@ -43,37 +243,176 @@ class HTTPClient:
         json: dict | None = None,
         params: dict | None = None,
     ) -> dict | list:
+        """Send a request and return the decoded JSON body.
+
+        Concurrent identical GET/HEAD requests are coalesced: only one
+        goes over the network and every caller decodes its own copy of
+        the shared response bytes.
+        """
+        if method not in _COALESCED_METHODS:
+            raw = await self._request_raw(method, path, json=json, params=params)
+        else:
+            raw = await self._shared_raw(method, path, params)
+        return _json.loads(raw) if raw else None
+
+    async def _shared_raw(
+        self, method: str, path: str, params: dict | None
+    ) -> bytes:
+        """Raw body of an idempotent request, joining an identical one in flight."""
+        key = (method, *_request_key(path, params))
+        task = self._inflight.get(key)
+        if task is not None:
+            return await asyncio.shield(task)
+
+        await self._ensure_session()
+        assert self._loop is not None
+        task = self._loop.create_task(
+            self._request_raw(method, path, params=params)
+        )
+        self._inflight[key] = task
+
+        def _done(t: asyncio.Task):
+            if self._inflight.get(key) is t:
+                del self._inflight[key]
+            if not t.cancelled():
+                t.exception()  # mark retrieved if every caller went away
+
+        task.add_done_callback(_done)
+        # Shielded so one caller being cancelled doesn't fail the others.
+        return await asyncio.shield(task)
+
+    async def _request_raw(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict | None = None,
+        params: dict | None = None,
+    ) -> bytes:
+        """Send a request and return the raw body of a successful response.
+
+        Error responses are decoded and raised; 429s are retried first.
+        """
         await self._ensure_session()
-        assert self._session is not None
         url = f"{self._base_url}{path}"
-        log.debug("%s %s", method, url)
 
-        async with self._session.request(
-            method, url, json=json, params=params
-        ) as resp:
-            if resp.status == 204:
-                return {}
-            body = await resp.json(content_type=None)
-            if resp.status >= 400:
-                if resp.status == 404:
-                    raise NotFound(resp.status, body if isinstance(body, dict) else {"error": str(body)})
-                if resp.status == 403:
-                    raise Forbidden(resp.status, body if isinstance(body, dict) else {"error": str(body)})
-                raise HTTPException(resp.status, body if isinstance(body, dict) else {"error": str(body)})
-            return body
+        async with self._sem:
+            attempt = 0
+            while True:
+                await self._wait_rate_limit()
+                log.debug("%s %s", method, url)
+                status, headers, raw = await self._send(
+                    method, url, json=json, params=params
+                )
+                if status == 204:
+                    return b"{}"  # decodes to {}, as before
+                if status < 400:
+                    return raw
+                body = _json.loads(raw) if raw else None
+                if status != 429:
+                    _raise_for_status(status, body)
+
+                retry_after = _parse_retry_after(headers.get("Retry-After"))
+                if attempt >= self._max_retries:
+                    _raise_for_status(status, body, retry_after)
+                if retry_after is None:
+                    retry_after = min(
+                        _BACKOFF_CAP, _BACKOFF_BASE * 2**attempt
+                    ) * random.uniform(0.5, 1.5)
+                attempt += 1
+                log.warning(
+                    "Rate limited on %s %s. Retrying in %.2fs (attempt %d/%d)",
+                    method,
+                    path,
+                    retry_after,
+                    attempt,
+                    self._max_retries,
+                )
+                self._global_until = max(
+                    self._global_until, self._loop.time() + retry_after
+                )
+
+    async def _wait_rate_limit(self):
+        assert self._loop is not None
+        delay = self._global_until - self._loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    # ── Response Cache ──────────────────────────────────────────
+
+    async def _cached_get(
+        self,
+        path: str,
+        *,
+        params: dict | None = None,
+        ttl: float | None = None,
+    ) -> dict | list:
+        """GET ``path``, serving from the response cache when possible.
+
+        The cache holds raw response bytes; every call decodes its own
+        copy, so callers can't mutate the stored body.
+        """
+        if not self._cache_enabled:
+            return await self.request("GET", path, params=params)
+
+        key = _request_key(path, params)
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            raw = entry[1]
+        else:
+            generation = self._generation(path)
+            raw = await self._shared_raw("GET", path, params)
+            # Don't cache a body that may predate a write made meanwhile.
+            if self._generation(path) == generation:
+                expires = now + (self._cache_ttl if ttl is None else ttl)
+                self._cache[key] = (expires, raw)
+        return _json.loads(raw) if raw else None
+
+    def _generation(self, path: str) -> int:
+        """Sum of the invalidation counters of ``path`` and its parents."""
+        gens = self._generations
+        total = gens.get(path, 0)
+        query = path.find("?")
+        if query != -1:
+            path = path[:query]
+            total += gens.get(path, 0)
+        i = path.find("/")
+        while i != -1:
+            total += gens.get(path[:i], 0)
+            i = path.find("/", i + 1)
+        return total
+
+    def _invalidate(self, prefix: str):
+        """Drop cached and in-flight GETs for ``prefix`` and paths below it."""
+        self._generations[prefix] = self._generations.get(prefix, 0) + 1
+        for key in [k for k in self._cache if _path_under(k[0], prefix)]:
+            del self._cache[key]
+        # Later callers start a fresh request instead of joining one that
+        # may have been answered before the write.
+        for key in [
+            k
+            for k in self._inflight
+            if k[0] in _COALESCED_METHODS and _path_under(k[1], prefix)
+        ]:
+            del self._inflight[key]
+
+    def clear_cache(self):
+        """Drop all cached responses."""
+        self._invalidate("")
 
     # ── Spaces ──────────────────────────────────────────────────
 
     async def get_spaces(self) -> list[dict]:
-        return await self.request("GET", "/spaces/me")
+        return await self._cached_get("/spaces/me")
 
     async def get_space(self, space_id: str) -> dict:
-        return await self.request("GET", f"/spaces/{space_id}")
+        return await self._cached_get(f"/spaces/{space_id}")
 
     # ── Members ─────────────────────────────────────────────────
 
     async def get_members(self, space_id: str) -> list[dict]:
-        return await self.request("GET", f"/spaces/{space_id}/members")
+        return await self._cached_get(f"/spaces/{space_id}/members")
 
     async def set_member_roles(
         self, space_id: str, user_id: str, role_ids: list[str]
@@ -83,16 +422,18 @@ class HTTPClient:
             f"/spaces/{space_id}/members/{user_id}/roles",
             json={"role_ids": role_ids},
         )
+        self._invalidate(f"/spaces/{space_id}/members")
 
     async def kick_member(self, space_id: str, user_id: str) -> None:
         await self.request(
             "DELETE", f"/spaces/{space_id}/members/{user_id}"
         )
+        self._invalidate(f"/spaces/{space_id}/members")
 
     # ── Channels ────────────────────────────────────────────────
 
     async def get_channels(self, space_id: str) -> list[dict]:
-        return await self.request("GET", f"/spaces/{space_id}/channels")
+        return await self._cached_get(f"/spaces/{space_id}/channels")
 
     async def create_channel(
         self,
@@ -108,23 +449,28 @@ class HTTPClient:
             body["topic"] = topic
         if category_id is not None:
             body["category_id"] = category_id
-        return await self.request(
+        data = await self.request(
             "POST", f"/spaces/{space_id}/channels", json=body
         )
+        self._invalidate(f"/spaces/{space_id}/channels")
+        return data
 
     async def update_channel(
         self, space_id: str, channel_id: str, **kwargs
     ) -> dict:
-        return await self.request(
+        data = await self.request(
             "PATCH",
             f"/spaces/{space_id}/channels/{channel_id}",
             json=kwargs,
         )
+        self._invalidate(f"/spaces/{space_id}/channels")
+        return data
 
     async def delete_channel(self, space_id: str, channel_id: str) -> None:
         await self.request(
             "DELETE", f"/spaces/{space_id}/channels/{channel_id}"
         )
+        self._invalidate(f"/spaces/{space_id}/channels")
 
     # ── Messages ────────────────────────────────────────────────
 
@@ -136,16 +482,16 @@ class HTTPClient:
         before: str | None = None,
         limit: int | None = None,
     ) -> list[dict]:
-        params: dict[str, str] = {}
-        if before:
-            params["before"] = before
-        if limit:
-            params["limit"] = str(limit)
-        return await self.request(
-            "GET",
-            f"/spaces/{space_id}/channels/{channel_id}/messages",
-            params=params or None,
-        )
+        path = f"/spaces/{space_id}/channels/{channel_id}/messages"
+        # Build the query string by hand; the common no-argument case then
+        # skips aiohttp's params encoding entirely.
+        if before and limit:
+            path = f"{path}?before={quote(before, safe='')}&limit={int(limit)}"
+        elif before:
+            path = f"{path}?before={quote(before, safe='')}"
+        elif limit:
+            path = f"{path}?limit={int(limit)}"
+        return await self.request("GET", path)
 
     async def send_message(
         self,
@@ -161,11 +507,13 @@ class HTTPClient:
             body["reply_to"] = reply_to
         if attachment_ids:
             body["attachment_ids"] = attachment_ids
-        return await self.request(
+        data = await self.request(
             "POST",
             f"/spaces/{space_id}/channels/{channel_id}/messages",
             json=body,
         )
+        self._invalidate(f"/spaces/{space_id}/channels/{channel_id}/messages")
+        return data
 
     async def edit_message(
         self,
@@ -174,11 +522,14 @@ class HTTPClient:
         message_id: str,
         content: str,
     ) -> dict:
-        return await self.request(
+        data = await self.request(
             "PATCH",
             f"/spaces/{space_id}/channels/{channel_id}/messages/{message_id}",
             json={"content": content},
         )
+        self._invalidate(f"/spaces/{space_id}/channels/{channel_id}/messages")
+        self._invalidate(f"/spaces/{space_id}/channels/{channel_id}/pins")
+        return data
 
     async def delete_message(
         self, space_id: str, channel_id: str, message_id: str
@@ -187,6 +538,8 @@ class HTTPClient:
             "DELETE",
             f"/spaces/{space_id}/channels/{channel_id}/messages/{message_id}",
         )
+        self._invalidate(f"/spaces/{space_id}/channels/{channel_id}/messages")
+        self._invalidate(f"/spaces/{space_id}/channels/{channel_id}/pins")
 
     # ── Reactions ───────────────────────────────────────────────
 
@@ -197,11 +550,14 @@ class HTTPClient:
         message_id: str,
         emoji: str,
     ) -> dict:
-        return await self.request(
+        data = await self.request(
             "PUT",
             f"/spaces/{space_id}/channels/{channel_id}/messages"
-            f"/{message_id}/reactions/{quote(emoji)}",
+            f"/{message_id}/reactions/{_quote_emoji(emoji)}",
         )
+        # Message lists carry reaction counts.
+        self._invalidate(f"/spaces/{space_id}/channels/{channel_id}/messages")
+        return data
 
     async def remove_reaction(
         self,
@@ -210,17 +566,20 @@ class HTTPClient:
         message_id: str,
         emoji: str,
     ) -> dict:
-        return await self.request(
+        data = await self.request(
             "DELETE",
             f"/spaces/{space_id}/channels/{channel_id}/messages"
-            f"/{message_id}/reactions/{quote(emoji)}",
+            f"/{message_id}/reactions/{_quote_emoji(emoji)}",
         )
+        # Message lists carry reaction counts.
+        self._invalidate(f"/spaces/{space_id}/channels/{channel_id}/messages")
+        return data
 
     # ── Pins ────────────────────────────────────────────────────
 
     async def get_pins(self, space_id: str, channel_id: str) -> list[dict]:
-        return await self.request(
-            "GET", f"/spaces/{space_id}/channels/{channel_id}/pins"
+        return await self._cached_get(
+            f"/spaces/{space_id}/channels/{channel_id}/pins"
         )
 
     async def pin_message(
@@ -230,6 +589,7 @@ class HTTPClient:
             "PUT",
             f"/spaces/{space_id}/channels/{channel_id}/pins/{message_id}",
         )
+        self._invalidate(f"/spaces/{space_id}/channels/{channel_id}/pins")
 
     async def unpin_message(
         self, space_id: str, channel_id: str, message_id: str
@@ -238,11 +598,12 @@ class HTTPClient:
             "DELETE",
             f"/spaces/{space_id}/channels/{channel_id}/pins/{message_id}",
         )
+        self._invalidate(f"/spaces/{space_id}/channels/{channel_id}/pins")
 
     # ── Roles ───────────────────────────────────────────────────
 
     async def get_roles(self, space_id: str) -> list[dict]:
-        return await self.request("GET", f"/spaces/{space_id}/roles")
+        return await self._cached_get(f"/spaces/{space_id}/roles")
 
     async def create_role(
         self,
@@ -257,21 +618,29 @@ class HTTPClient:
             body["color"] = color
         if hoist is not None:
             body["hoist"] = hoist
-        return await self.request(
+        data = await self.request(
             "POST", f"/spaces/{space_id}/roles", json=body
         )
+        self._invalidate(f"/spaces/{space_id}/roles")
+        return data
 
     async def update_role(
         self, space_id: str, role_id: str, **kwargs
     ) -> dict:
-        return await self.request(
+        data = await self.request(
             "PATCH", f"/spaces/{space_id}/roles/{role_id}", json=kwargs
         )
+        # Members embed role name/color, so their cached copy is stale too.
+        self._invalidate(f"/spaces/{space_id}/roles")
+        self._invalidate(f"/spaces/{space_id}/members")
+        return data
 
     async def delete_role(self, space_id: str, role_id: str) -> None:
         await self.request(
             "DELETE", f"/spaces/{space_id}/roles/{role_id}"
         )
+        self._invalidate(f"/spaces/{space_id}/roles")
+        self._invalidate(f"/spaces/{space_id}/members")
 
     # ── Invites ─────────────────────────────────────────────────
 
@@ -287,49 +656,70 @@ class HTTPClient:
             body["max_uses"] = max_uses
         if expires_in_seconds is not None:
             body["expires_in_seconds"] = expires_in_seconds
-        return await self.request(
+        data = await self.request(
             "POST", f"/spaces/{space_id}/invites", json=body or None
         )
+        self._invalidate(f"/spaces/{space_id}/invites")
+        return data
 
     async def get_invites(self, space_id: str) -> list[dict]:
-        return await self.request("GET", f"/spaces/{space_id}/invites")
+        return await self._cached_get(f"/spaces/{space_id}/invites")
 
     # ── Categories ───────────────────────────────────────────────
 
     async def get_categories(self, space_id: str) -> list[dict]:
-        return await self.request("GET", f"/spaces/{space_id}/categories")
+        return await self._cached_get(f"/spaces/{space_id}/categories")
 
     # ── Emojis ──────────────────────────────────────────────────
 
     async def get_emojis(self, space_id: str) -> list[dict]:
-        return await self.request("GET", f"/spaces/{space_id}/emojis")
+        return await self._cached_get(f"/spaces/{space_id}/emojis")
 
     # ── File Uploads ────────────────────────────────────────────
 
     async def upload_file(
         self, space_id: str, channel_id: str, file_path: str
     ) -> dict:
-        """Upload a file attachment (multipart/form-data)."""
-        import os
+        """Upload a file attachment (multipart/form-data).
 
+        The file is opened (and, for the httpx backend, read) in a worker
+        thread; aiohttp streams it from disk. Either way large uploads
+        don't block the event loop.
+        """
         await self._ensure_session()
-        assert self._session is not None
-
-        data = aiohttp.FormData()
-        data.add_field(
-            "file",
-            open(file_path, "rb"),  # noqa: SIM115
-            filename=os.path.basename(file_path),
-        )
+        assert self._loop is not None
 
         url = (
             f"{self._base_url}/spaces/{space_id}"
             f"/channels/{channel_id}/attachments"
         )
-        headers = {"Authorization": f"Bearer {self._token}"}
-
-        async with self._session.post(url, data=data, headers=headers) as resp:
-            body = await resp.json(content_type=None)
-            if resp.status >= 400:
-                raise HTTPException(resp.status, body if isinstance(body, dict) else {"error": str(body)})
-            return body
+        filename = os.path.basename(file_path)
+
+        f = await self._loop.run_in_executor(None, open, file_path, "rb")
+        try:
+            async with self._sem:
+                await self._wait_rate_limit()
+                if self._httpx is not None:
+                    content = await self._loop.run_in_executor(None, f.read)
+                    resp = await self._httpx.post(
+                        url, files={"file": (filename, content)}
+                    )
+                    status, headers, raw = (
+                        resp.status_code, resp.headers, resp.content
+                    )
+                else:
+                    assert self._session is not None
+                    data = aiohttp.FormData()
+                    data.add_field("file", f, filename=filename)
+                    async with self._session.post(url, data=data) as resp:
+                        status, headers, raw = (
+                            resp.status, resp.headers, await resp.read()
+                        )
+        finally:
+            f.close()
+
+        body = _json.loads(raw) if raw else None
+        _raise_for_status(
+            status, body, _parse_retry_after(headers.get("Retry-After"))
+        )
+        return body
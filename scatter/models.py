@@ -2,19 +2,106 @@
 
 from __future__ import annotations
 
+import functools
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, ClassVar, Optional
+from weakref import WeakValueDictionary
+
+from . import _json
 
 
 def _parse_dt(s: str | None) -> datetime | None:
     if not s:
         return None
-    return datetime.fromisoformat(s.replace("Z", "+00:00"))
+    return _parse_dt_cached(s)
+
+
+# Bulk payloads repeat timestamps a lot (members created together, bursts
+# of messages in the same second); datetimes are immutable, so share them.
+# fromisoformat accepts a trailing "Z" natively since Python 3.11.
+@functools.lru_cache(maxsize=4096)
+def _parse_dt_cached(s: str) -> datetime:
+    return datetime.fromisoformat(s)
+
+
+# Shared default for missing nested objects (e.g. "author"); only ever read.
+_EMPTY_DICT: dict = {}
+
+
+# For small enumerated fields (presence, channel_type, ...) only: the set
+# of values is tiny, and interned strings may never be freed (CPython 3.12).
+def _intern(s):
+    # Payload values can be null; only strings can be interned.
+    return sys.intern(s) if type(s) is str else s
+
+
+# Ids and names repeat across payloads (the same author on every message)
+# but are unbounded over a bot's lifetime, so they are deduplicated through
+# a capped table instead of sys.intern. Clearing it when full only costs
+# sharing for values seen before that point.
+_SHARED_STRINGS_MAX = 50_000
+_shared_strings: dict[str, str] = {}
 
 
-@dataclass
-class User:
+def _share(s):
+    if type(s) is not str:
+        return s
+    if len(_shared_strings) >= _SHARED_STRINGS_MAX:
+        _shared_strings.clear()
+    return _shared_strings.setdefault(s, s)
+
+
+class _Versioned:
+    """Mixin for models stamped with ``updated_at``.
+
+    :meth:`from_dict_cached` hands back the live instance already built for
+    the same ``id`` as long as its ``updated_at`` still matches, instead of
+    constructing a new one. Instances are held weakly, so the cache never
+    keeps anything alive on its own.
+    """
+
+    __slots__ = ()
+
+    _instances: ClassVar[WeakValueDictionary]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._instances = WeakValueDictionary()
+
+    @classmethod
+    def from_dict_cached(cls, d: dict):
+        inst = cls._instances.get(d["id"])
+        if inst is not None and inst.updated_at is not None:
+            if inst.updated_at == _parse_dt(d.get("updated_at")):
+                return inst
+        inst = cls.from_dict(d)  # type: ignore[attr-defined]
+        cls._instances[inst.id] = inst
+        return inst
+
+
+class _FromJSON:
+    """Mixin adding :meth:`from_json` on top of a model's ``from_dict``."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_json(cls, raw: bytes | str, **kwargs: Any):
+        """Build the model from a raw JSON document (orjson/msgspec if installed).
+
+        Keyword arguments are passed through to ``from_dict``.
+        """
+        return cls.from_dict(_json.loads(raw), **kwargs)  # type: ignore[attr-defined]
+
+
+# Every from_dict below passes fields positionally, in declaration order:
+# keyword matching in the generated __init__ costs more than the whole
+# positional call. Keep the argument order in sync with the fields.
+
+
+@dataclass(slots=True)
+class User(_FromJSON):
     id: str
     username: str
     display_name: str
@@ -26,20 +113,23 @@ class User:
 
     @classmethod
     def from_dict(cls, d: dict) -> User:
+        get = d.get
         return cls(
-            id=d["id"],
-            username=d.get("username", ""),
-            display_name=d.get("display_name", ""),
-            avatar_url=d.get("avatar_url"),
-            presence=d.get("presence", "offline"),
-            custom_status=d.get("custom_status"),
-            subscription_tier=d.get("subscription_tier", "free"),
-            is_admin=d.get("is_admin", False),
+            # The same author shows up on many messages; share so a
+            # channel's scrollback holds one copy of each user's strings.
+            _share(d["id"]),
+            _share(get("username", "")),
+            _share(get("display_name", "")),
+            get("avatar_url"),
+            _intern(get("presence", "offline")),
+            get("custom_status"),
+            _intern(get("subscription_tier", "free")),
+            get("is_admin", False),
         )
 
 
-@dataclass
-class MemberRoleInfo:
+@dataclass(slots=True)
+class MemberRoleInfo(_FromJSON):
     id: str
     name: str
     color: Optional[int] = None
@@ -49,16 +139,17 @@ class MemberRoleInfo:
     @classmethod
     def from_dict(cls, d: dict) -> MemberRoleInfo:
         return cls(
-            id=d["id"],
-            name=d["name"],
-            color=d.get("color"),
-            position=d.get("position", 0),
-            hoist=d.get("hoist", False),
+            # Every member holding a role repeats its id and name.
+            _share(d["id"]),
+            _share(d["name"]),
+            d.get("color"),
+            d.get("position", 0),
+            d.get("hoist", False),
         )
 
 
-@dataclass
-class Member:
+@dataclass(slots=True)
+class Member(_FromJSON):
     """A user within a specific space, with role info."""
 
     id: str
@@ -74,32 +165,34 @@ class Member:
 
     @classmethod
     def from_dict(cls, d: dict) -> Member:
+        get = d.get
         return cls(
-            id=d["id"],
-            username=d.get("username", ""),
-            display_name=d.get("display_name", ""),
-            avatar_url=d.get("avatar_url"),
-            presence=d.get("presence", "offline"),
-            custom_status=d.get("custom_status"),
-            subscription_tier=d.get("subscription_tier", "free"),
-            is_admin=d.get("is_admin", False),
-            roles=[MemberRoleInfo.from_dict(r) for r in d.get("roles", [])],
-            joined_at=_parse_dt(d.get("joined_at")),
+            # Shared with the same user's messages and with earlier fetches.
+            _share(d["id"]),
+            _share(get("username", "")),
+            _share(get("display_name", "")),
+            get("avatar_url"),
+            _intern(get("presence", "offline")),
+            get("custom_status"),
+            _intern(get("subscription_tier", "free")),
+            get("is_admin", False),
+            list(map(_CHILD_BUILDERS["roles"], v)) if (v := get("roles")) else [],
+            _parse_dt(get("joined_at")),
         )
 
 
-@dataclass
-class RolePermission:
+@dataclass(slots=True)
+class RolePermission(_FromJSON):
     permission: str
     granted: bool
 
     @classmethod
     def from_dict(cls, d: dict) -> RolePermission:
-        return cls(permission=d["permission"], granted=d["granted"])
+        return cls(d["permission"], d["granted"])
 
 
-@dataclass
-class Role:
+@dataclass(slots=True)
+class Role(_FromJSON):
     id: str
     space_id: str
     name: str
@@ -112,23 +205,26 @@ class Role:
 
     @classmethod
     def from_dict(cls, d: dict) -> Role:
+        get = d.get
         return cls(
-            id=d["id"],
-            space_id=d.get("space_id", ""),
-            name=d["name"],
-            color=d.get("color"),
-            position=d.get("position", 0),
-            inherits_from=d.get("inherits_from"),
-            is_default=d.get("is_default", False),
-            hoist=d.get("hoist", False),
-            permissions=[
-                RolePermission.from_dict(p) for p in d.get("permissions", [])
-            ],
+            d["id"],
+            get("space_id", ""),
+            d["name"],
+            get("color"),
+            get("position", 0),
+            get("inherits_from"),
+            get("is_default", False),
+            get("hoist", False),
+            (
+                list(map(_CHILD_BUILDERS["permissions"], v))
+                if (v := get("permissions"))
+                else []
+            ),
         )
 
 
-@dataclass
-class Channel:
+@dataclass(slots=True, weakref_slot=True)
+class Channel(_Versioned, _FromJSON):
     id: str
     space_id: str
     name: str
@@ -142,20 +238,20 @@ class Channel:
     @classmethod
     def from_dict(cls, d: dict) -> Channel:
         return cls(
-            id=d["id"],
-            space_id=d.get("space_id", ""),
-            name=d["name"],
-            channel_type=d.get("channel_type", "text"),
-            topic=d.get("topic"),
-            category_id=d.get("category_id"),
-            position=d.get("position", 0),
-            created_at=_parse_dt(d.get("created_at")),
-            updated_at=_parse_dt(d.get("updated_at")),
+            d["id"],
+            d.get("space_id", ""),
+            d["name"],
+            _intern(d.get("channel_type", "text")),
+            d.get("topic"),
+            d.get("category_id"),
+            d.get("position", 0),
+            _parse_dt(d.get("created_at")),
+            _parse_dt(d.get("updated_at")),
         )
 
 
-@dataclass
-class ChannelCategory:
+@dataclass(slots=True)
+class ChannelCategory(_FromJSON):
     id: str
     space_id: str
     name: str
@@ -165,16 +261,16 @@ class ChannelCategory:
     @classmethod
     def from_dict(cls, d: dict) -> ChannelCategory:
         return cls(
-            id=d["id"],
-            space_id=d.get("space_id", ""),
-            name=d["name"],
-            position=d.get("position", 0),
-            created_at=_parse_dt(d.get("created_at")),
+            d["id"],
+            d.get("space_id", ""),
+            d["name"],
+            d.get("position", 0),
+            _parse_dt(d.get("created_at")),
         )
 
 
-@dataclass
-class Attachment:
+@dataclass(slots=True)
+class Attachment(_FromJSON):
     id: str
     filename: str
     original_filename: str
@@ -187,19 +283,19 @@ class Attachment:
     @classmethod
     def from_dict(cls, d: dict) -> Attachment:
         return cls(
-            id=d["id"],
-            filename=d["filename"],
-            original_filename=d.get("original_filename", d["filename"]),
-            content_type=d.get("content_type", ""),
-            size_bytes=d.get("size_bytes", 0),
-            url=d["url"],
-            width=d.get("width"),
-            height=d.get("height"),
+            d["id"],
+            d["filename"],
+            d.get("original_filename", d["filename"]),
+            _share(d.get("content_type", "")),
+            d.get("size_bytes", 0),
+            d["url"],
+            d.get("width"),
+            d.get("height"),
         )
 
 
-@dataclass
-class Embed:
+@dataclass(slots=True)
+class Embed(_FromJSON):
     id: str
     url: str
     embed_type: str = "link"
@@ -215,22 +311,22 @@ class Embed:
     @classmethod
     def from_dict(cls, d: dict) -> Embed:
         return cls(
-            id=d.get("id", ""),
-            url=d.get("url", ""),
-            embed_type=d.get("embed_type", "link"),
-            title=d.get("title"),
-            description=d.get("description"),
-            thumbnail_url=d.get("thumbnail_url"),
-            site_name=d.get("site_name"),
-            color=d.get("color"),
-            image_url=d.get("image_url"),
-            video_url=d.get("video_url"),
-            provider_name=d.get("provider_name"),
+            d.get("id", ""),
+            d.get("url", ""),
+            _intern(d.get("embed_type", "link")),
+            d.get("title"),
+            d.get("description"),
+            d.get("thumbnail_url"),
+            d.get("site_name"),
+            d.get("color"),
+            d.get("image_url"),
+            d.get("video_url"),
+            d.get("provider_name"),
         )
 
 
-@dataclass
-class Reaction:
+@dataclass(slots=True)
+class Reaction(_FromJSON):
     emoji: str
     count: int
     user_reacted: bool = False
@@ -238,14 +334,26 @@ class Reaction:
     @classmethod
     def from_dict(cls, d: dict) -> Reaction:
         return cls(
-            emoji=d["emoji"],
-            count=d["count"],
-            user_reacted=d.get("user_reacted", False),
+            d["emoji"],
+            d["count"],
+            d.get("user_reacted", False),
         )
 
 
-@dataclass
-class MessagePreview:
+# Child constructors keyed by the payload field they parse. Accessing
+# ``Embed.from_dict`` creates a fresh bound method on every call; these are
+# bound once at import time.
+_CHILD_BUILDERS: dict[str, Callable[[dict], Any]] = {
+    "roles": MemberRoleInfo.from_dict,
+    "permissions": RolePermission.from_dict,
+    "embeds": Embed.from_dict,
+    "attachments": Attachment.from_dict,
+    "reactions": Reaction.from_dict,
+}
+
+
+@dataclass(slots=True)
+class MessagePreview(_FromJSON):
     """A lightweight preview of a replied-to message."""
 
     id: str
@@ -255,14 +363,14 @@ class MessagePreview:
     @classmethod
     def from_dict(cls, d: dict) -> MessagePreview:
         return cls(
-            id=d["id"],
-            author=User.from_dict(d.get("author", {})),
-            content=d.get("content", ""),
+            d["id"],
+            User.from_dict(d.get("author", _EMPTY_DICT)),
+            d.get("content", ""),
         )
 
 
-@dataclass
-class Message:
+@dataclass(slots=True)
+class Message(_FromJSON):
     id: str
     channel_id: str
     content: str
@@ -279,31 +387,31 @@ class Message:
 
     @classmethod
     def from_dict(cls, d: dict, *, space_id: str | None = None) -> Message:
-        author_data = d.get("author", {})
-        replied = d.get("replied_message")
+        get = d.get
+        build = _CHILD_BUILDERS
+        author_data = get("author", _EMPTY_DICT)
+        replied = get("replied_message")
         return cls(
-            id=d["id"],
-            channel_id=d.get("channel_id", ""),
-            content=d.get("content", ""),
-            author=User.from_dict(author_data),
-            space_id=space_id,
-            created_at=_parse_dt(d.get("created_at")),
-            edited_at=_parse_dt(d.get("edited_at")),
-            reply_to=d.get("reply_to"),
-            ping_author=d.get("ping_author", False),
-            embeds=[Embed.from_dict(e) for e in d.get("embeds", [])],
-            attachments=[
-                Attachment.from_dict(a) for a in d.get("attachments", [])
-            ],
-            reactions=[
-                Reaction.from_dict(r) for r in d.get("reactions", [])
-            ],
-            replied_message=MessagePreview.from_dict(replied) if replied else None,
+            d["id"],
+            _share(get("channel_id", "")),
+            get("content", ""),
+            User.from_dict(author_data),
+            space_id,
+            _parse_dt(get("created_at")),
+            _parse_dt(get("edited_at")),
+            get("reply_to"),
+            get("ping_author", False),
+            # Most messages carry none of these; a bare [] skips the
+            # map/list() round trip for the empty case.
+            list(map(build["embeds"], v)) if (v := get("embeds")) else [],
+            list(map(build["attachments"], v)) if (v := get("attachments")) else [],
+            list(map(build["reactions"], v)) if (v := get("reactions")) else [],
+            MessagePreview.from_dict(replied) if replied else None,
         )
 
 
-@dataclass
-class CustomEmoji:
+@dataclass(slots=True)
+class CustomEmoji(_FromJSON):
     id: str
     space_id: str
     name: str
@@ -314,17 +422,26 @@ class CustomEmoji:
     @classmethod
     def from_dict(cls, d: dict) -> CustomEmoji:
         return cls(
-            id=d["id"],
-            space_id=d.get("space_id", ""),
-            name=d["name"],
-            image_url=d["image_url"],
-            uploaded_by=d.get("uploaded_by", ""),
-            created_at=_parse_dt(d.get("created_at")),
+            d["id"],
+            d.get("space_id", ""),
+            d["name"],
+            d["image_url"],
+            d.get("uploaded_by", ""),
+            _parse_dt(d.get("created_at")),
         )
 
 
-@dataclass
-class Space:
+_SPACE_CHILDREN: tuple[tuple[str, Callable[[dict], Any]], ...] = (
+    ("channels", Channel.from_dict),
+    ("members", Member.from_dict),
+    ("roles", Role.from_dict),
+    ("categories", ChannelCategory.from_dict),
+    ("custom_emojis", CustomEmoji.from_dict),
+)
+
+
+@dataclass(slots=True, weakref_slot=True)
+class Space(_Versioned, _FromJSON):
     id: str
     name: str
     description: Optional[str] = None
@@ -341,30 +458,27 @@ class Space:
 
     @classmethod
     def from_dict(cls, d: dict) -> Space:
-        channels = d.get("channels")
-        members = d.get("members")
-        roles = d.get("roles")
-        categories = d.get("categories")
-        custom_emojis = d.get("custom_emojis")
+        get = d.get
         return cls(
-            id=d["id"],
-            name=d["name"],
-            description=d.get("description"),
-            icon_url=d.get("icon_url"),
-            owner_id=d.get("owner_id"),
-            is_public=d.get("is_public", False),
-            created_at=_parse_dt(d.get("created_at")),
-            updated_at=_parse_dt(d.get("updated_at")),
-            channels=[Channel.from_dict(c) for c in channels] if channels is not None else None,
-            members=[Member.from_dict(m) for m in members] if members is not None else None,
-            roles=[Role.from_dict(r) for r in roles] if roles is not None else None,
-            categories=[ChannelCategory.from_dict(c) for c in categories] if categories is not None else None,
-            custom_emojis=[CustomEmoji.from_dict(e) for e in custom_emojis] if custom_emojis is not None else None,
+            d["id"],
+            d["name"],
+            get("description"),
+            get("icon_url"),
+            get("owner_id"),
+            get("is_public", False),
+            _parse_dt(get("created_at")),
+            _parse_dt(get("updated_at")),
+            # Child lists follow updated_at in _SPACE_CHILDREN order; a key
+            # that's absent stays None (not loaded), unlike an empty list.
+            *[
+                list(map(build, v)) if (v := get(key)) is not None else None
+                for key, build in _SPACE_CHILDREN
+            ],
         )
 
 
-@dataclass
-class Invite:
+@dataclass(slots=True)
+class Invite(_FromJSON):
     id: str
     space_id: str
     code: str
@@ -378,18 +492,21 @@ class Invite:
 
     @classmethod
     def from_dict(cls, d: dict) -> Invite:
-        created_by = d.get("created_by", "")
-        if isinstance(created_by, dict):
+        get = d.get
+        # The API sends either the creator's id or an expanded user object;
+        # an exact type check is cheaper than isinstance for the id case.
+        created_by = get("created_by", "")
+        if type(created_by) is dict:
             created_by = created_by.get("id", "")
         return cls(
-            id=d["id"],
-            space_id=d.get("space_id", ""),
-            code=d["code"],
-            created_by=created_by,
-            max_uses=d.get("max_uses"),
-            use_count=d.get("use_count", 0),
-            is_expired=d.get("is_expired", False),
-            expires_at=_parse_dt(d.get("expires_at")),
-            created_at=_parse_dt(d.get("created_at")),
-            url=d.get("url", ""),
+            d["id"],
+            get("space_id", ""),
+            d["code"],
+            created_by,
+            get("max_uses"),
+            get("use_count", 0),
+            get("is_expired", False),
+            _parse_dt(get("expires_at")),
+            _parse_dt(get("created_at")),
+            get("url", ""),
         )
@@ -0,0 +1,46 @@
+"""Client event dispatch side effects."""
+
+import pytest
+
+import scatter
+
+pytestmark = pytest.mark.asyncio
+
+PINS = "/spaces/s1/channels/c1/pins"
+MEMBERS = "/spaces/s1/members"
+
+
+@pytest.fixture
+def client():
+    client = scatter.Client("token")
+    for path in (PINS, MEMBERS, "/spaces/s1/roles"):
+        client.http._cache[(path, ())] = (float("inf"), b"[]")
+    return client
+
+
+def cached_paths(client):
+    return {path for path, _ in client.http._cache}
+
+
+@pytest.mark.parametrize(
+    "event_type", ["message_edited", "message_deleted", "message_pinned"]
+)
+async def test_message_events_invalidate_pins(client, event_type):
+    await client._dispatch(
+        event_type,
+        {"type": event_type, "space_id": "s1", "channel_id": "c1", "id": "m1"},
+    )
+    assert cached_paths(client) == {MEMBERS, "/spaces/s1/roles"}
+
+
+async def test_member_join_invalidates_members(client):
+    await client._dispatch(
+        "member_joined",
+        {"type": "member_joined", "space_id": "s1", "user": {"id": "u1"}},
+    )
+    assert cached_paths(client) == {PINS, "/spaces/s1/roles"}
+
+
+async def test_event_missing_path_keys_is_ignored(client):
+    await client._dispatch("message_edited", {"type": "message_edited"})
+    assert cached_paths(client) == {PINS, MEMBERS, "/spaces/s1/roles"}
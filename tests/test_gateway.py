@@ -0,0 +1,76 @@
+"""Gateway handshake against an in-process WebSocket server."""
+
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+import scatter
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def ws_server():
+    """Yield ``(url, frames, auth_ok)``; set ``auth_ok`` to shape the reply."""
+    frames: list[dict] = []
+    auth_ok = {"type": "auth_ok", "user_id": "me"}
+
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for msg in ws:
+            frame = json.loads(msg.data)
+            frames.append(frame)
+            if frame["type"] == "auth":
+                await ws.send_json(auth_ok)
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/ws", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"ws://127.0.0.1:{port}/ws", frames, auth_ok
+    await runner.cleanup()
+
+
+async def run_until_ready(url: str) -> scatter.Client:
+    client = scatter.Client("token", ws_url=url)
+
+    @client.event
+    async def on_ready(data):
+        await client.subscribe_channels(["a", "b"])
+        await asyncio.sleep(0.05)
+        await client.close()
+
+    try:
+        await asyncio.wait_for(client.start(), timeout=5)
+    finally:
+        await client.close()  # no-op if on_ready already closed it
+    return client
+
+
+@pytest.mark.parametrize("features", [None, "missing"])
+async def test_auth_ok_without_features(ws_server, features):
+    url, frames, auth_ok = ws_server
+    if features != "missing":
+        auth_ok["features"] = features
+
+    client = await run_until_ready(url)
+
+    assert client.user_id == "me"
+    assert [f["type"] for f in frames] == ["auth", "subscribe", "subscribe"]
+
+
+async def test_auth_ok_with_batch_subscribe(ws_server):
+    url, frames, auth_ok = ws_server
+    auth_ok["features"] = ["subscribe_batch"]
+
+    await run_until_ready(url)
+
+    assert frames[1] == {"type": "subscribe_batch", "channel_ids": ["a", "b"]}
@@ -0,0 +1,161 @@
+"""HTTPClient single-flight, response cache and retry behaviour."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from scatter import RateLimited
+from scatter.http import HTTPClient
+
+pytestmark = pytest.mark.asyncio
+
+SPACE = "s1"
+CHANNEL = "c1"
+MESSAGES = f"/api/spaces/{SPACE}/channels/{CHANNEL}/messages"
+
+
+class FakeAPI:
+    """Minimal in-memory Scatter API; every GET takes ``delay`` seconds."""
+
+    def __init__(self):
+        self.delay = 0.0
+        self.calls: list[tuple[str, str]] = []
+        self.channels = [{"id": "c1", "space_id": SPACE, "name": "general"}]
+        self.messages: list[dict] = []
+        self.rate_limited = 0
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get(f"/api/spaces/{SPACE}/channels", self.get_channels)
+        app.router.add_post(f"/api/spaces/{SPACE}/channels", self.create_channel)
+        app.router.add_get(MESSAGES, self.get_messages)
+        app.router.add_post(MESSAGES, self.send_message)
+        app.router.add_get("/api/limited", self.limited)
+        return app
+
+    async def _read(self, request, body):
+        self.calls.append((request.method, request.path_qs))
+        snapshot = list(body)  # state as of when the request arrived
+        await asyncio.sleep(self.delay)
+        return web.json_response(snapshot)
+
+    async def get_channels(self, request):
+        return await self._read(request, self.channels)
+
+    async def create_channel(self, request):
+        self.calls.append((request.method, request.path_qs))
+        channel = {"id": f"c{len(self.channels) + 1}", "space_id": SPACE}
+        channel.update(await request.json())
+        self.channels.append(channel)
+        return web.json_response(channel)
+
+    async def get_messages(self, request):
+        return await self._read(request, self.messages)
+
+    async def send_message(self, request):
+        self.calls.append((request.method, request.path_qs))
+        message = {
+            "id": f"m{len(self.messages) + 1}",
+            "channel_id": CHANNEL,
+            "author": {"id": "u1"},
+        }
+        message.update(await request.json())
+        self.messages.append(message)
+        return web.json_response(message)
+
+    async def limited(self, request):
+        self.calls.append((request.method, request.path_qs))
+        if self.rate_limited:
+            self.rate_limited -= 1
+            return web.json_response(
+                {"error": "slow down"}, status=429, headers={"Retry-After": "0.01"}
+            )
+        return web.json_response({"ok": True})
+
+
+@pytest_asyncio.fixture
+async def api():
+    fake = FakeAPI()
+    runner = web.AppRunner(fake.app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    fake.base_url = f"http://127.0.0.1:{port}/api"
+    yield fake
+    await runner.cleanup()
+
+
+@pytest_asyncio.fixture
+async def http(api):
+    client = HTTPClient("token", base_url=api.base_url, max_retries=2)
+    yield client
+    await client.close()
+
+
+async def test_concurrent_gets_share_one_request(api, http):
+    api.delay = 0.05
+    results = await asyncio.gather(*(http.get_channels(SPACE) for _ in range(5)))
+    assert api.calls == [("GET", f"/api/spaces/{SPACE}/channels")]
+    # Every caller decodes its own copy.
+    results[0][0]["name"] = "changed"
+    assert all(r[0]["name"] == "general" for r in results[1:])
+
+
+async def test_cache_hit_returns_fresh_copy(api, http):
+    first = await http.get_channels(SPACE)
+    first.append({"id": "bogus"})
+    second = await http.get_channels(SPACE)
+    assert len(api.calls) == 1
+    assert [c["id"] for c in second] == ["c1"]
+
+
+async def test_write_during_cached_get_is_not_missed(api, http):
+    api.delay = 0.05
+    stale = asyncio.ensure_future(http.get_channels(SPACE))
+    await asyncio.sleep(0.01)
+    await http.create_channel(SPACE, "new")
+
+    fresh = await http.get_channels(SPACE)
+    assert [c["name"] for c in fresh] == ["general", "new"]
+    assert len(await stale) == 1
+    # The response that predates the write must not have been cached.
+    assert [c["name"] for c in await http.get_channels(SPACE)] == ["general", "new"]
+
+
+async def test_get_messages_sees_own_send(api, http):
+    api.delay = 0.05
+    poll = asyncio.ensure_future(http.get_messages(SPACE, CHANNEL))
+    await asyncio.sleep(0.01)
+    await http.send_message(SPACE, CHANNEL, "hello")
+
+    messages = await http.get_messages(SPACE, CHANNEL)
+    assert [m["content"] for m in messages] == ["hello"]
+    assert await poll == []
+
+
+async def test_paginated_get_messages_sees_own_send(api, http):
+    api.delay = 0.05
+    poll = asyncio.ensure_future(http.get_messages(SPACE, CHANNEL, limit=50))
+    await asyncio.sleep(0.01)
+    await http.send_message(SPACE, CHANNEL, "hello")
+
+    messages = await http.get_messages(SPACE, CHANNEL, limit=50)
+    assert [m["content"] for m in messages] == ["hello"]
+    await poll
+
+
+async def test_rate_limit_is_retried(api, http):
+    api.rate_limited = 1
+    assert await http.request("GET", "/limited") == {"ok": True}
+    assert len(api.calls) == 2
+
+
+async def test_rate_limit_raises_after_max_retries(api, http):
+    api.rate_limited = 10
+    with pytest.raises(RateLimited) as exc_info:
+        await http.request("GET", "/limited")
+    assert exc_info.value.retry_after == pytest.approx(0.01)
+    assert len(api.calls) == 3